@@ -36,6 +36,7 @@ setup(
         "dev": [
             "pytest>=7.4.0",
             "pytest-cov>=4.1.0",
+            "pytest-xdist>=3.5.0",
             "black>=23.12.0",
             "ruff>=0.1.8",
             "mypy>=1.7.0",
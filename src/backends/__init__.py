@@ -1,2 +1,4 @@
 """Model backend implementations"""
 
+# Hosted backends that take an API key and OpenAI-style message lists
+API_BACKENDS = frozenset({"openai", "anthropic", "google", "mistral-ai", "cohere", "groq"})
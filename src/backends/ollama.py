@@ -3,12 +3,28 @@ Ollama backend implementation
 Supports local Ollama models
 """
 
-import requests
+from functools import lru_cache
 from typing import Dict, Any, Optional, AsyncIterator
 import asyncio
 import json
+import os
+import subprocess
 
 from .base import BaseBackend, ModelResponse
+from ..core.connection_pool import ConnectionPoolManager
+
+
+@lru_cache(maxsize=None)
+def _ollama_env() -> Dict[str, str]:
+    """
+    Environment for ollama subprocesses, built once on first use
+    
+    Built lazily rather than at import so variables loaded from .env by
+    ConfigManager are included.
+    """
+    env = os.environ.copy()
+    env['PYTHONIOENCODING'] = 'utf-8'
+    return env
 
 
 class OllamaBackend(BaseBackend):
@@ -18,11 +34,18 @@ class OllamaBackend(BaseBackend):
         super().__init__(config)
         self.base_url = config.get("base_url", "http://localhost:11434")
         self.timeout = config.get("timeout", 120)
+        # Get session with connection pooling; no retries, since replaying a
+        # generation request would start the generation over
+        self.session = ConnectionPoolManager.get_session(
+            "ollama",
+            self.base_url,
+            config.get("pool_config", {"pool_maxsize": 64, "max_retries": 0, "status_forcelist": []})
+        )
     
     def is_available(self) -> bool:
         """Check if Ollama is available"""
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.base_url}/api/tags",
                 timeout=5
             )
@@ -33,7 +56,7 @@ class OllamaBackend(BaseBackend):
     def list_models(self) -> list[str]:
         """List available Ollama models"""
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.base_url}/api/tags",
                 timeout=10
             )
@@ -76,7 +99,7 @@ class OllamaBackend(BaseBackend):
             payload["options"].update(kwargs["options"])
         
         try:
-            response = requests.post(
+            response = self.session.post(
                 url,
                 json=payload,
                 timeout=self.timeout
@@ -162,23 +185,18 @@ class OllamaBackend(BaseBackend):
         Returns:
             Dictionary with download information
         """
-        import subprocess
-        import sys
-        import re
-        
         try:
-            # Set up environment for UTF-8
-            env = os.environ.copy()
-            env['PYTHONIOENCODING'] = 'utf-8'
-            
-            # Run ollama pull command
+            # Run ollama pull command; output is read in 8KB blocks and decoded
+            # to text by the buffered reader rather than byte by byte
             process = subprocess.Popen(
                 ["ollama", "pull", model],
                 stdout=subprocess.PIPE,
                 stderr=subprocess.STDOUT,
-                bufsize=1,
-                env=env,
-                universal_newlines=False
+                bufsize=8192,
+                text=True,
+                encoding='utf-8',
+                errors='replace',
+                env=_ollama_env()
             )
             
             return {
@@ -202,8 +220,6 @@ class OllamaBackend(BaseBackend):
         Returns:
             Dictionary with deletion status and information
         """
-        import subprocess
-        
         try:
             # Run ollama rm command
             process = subprocess.Popen(
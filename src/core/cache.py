@@ -2,9 +2,11 @@
 Response Cache - caches AI responses for performance
 """
 
-from typing import Dict, Any, Optional
+from collections import OrderedDict
+from typing import Callable, Dict, Any, Hashable, Optional
 import hashlib
 import json
+import threading
 import time
 from pathlib import Path
 import logging
@@ -168,3 +170,52 @@ class ResponseCache:
             "ttl": self.ttl
         }
 
+
+class LRUCache:
+    """Thread-safe, size-bounded LRU mapping with an optional per-entry TTL"""
+    
+    def __init__(self, maxsize: int = 128, ttl: Optional[float] = None,
+                 timer: Callable[[], float] = time.monotonic):
+        """
+        Initialize LRU cache
+        
+        Args:
+            maxsize: Maximum number of entries; the least recently used is evicted first
+            ttl: Seconds an entry stays valid, or None for no expiry
+            timer: Clock used for TTL checks (monotonic by default)
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.timer = timer
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value for key, or default if missing or expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            stored_at, value = entry
+            if self.ttl is not None and self.timer() - stored_at >= self.ttl:
+                del self._entries[key]
+                return default
+            self._entries.move_to_end(key)
+            return value
+    
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store value under key, evicting the least recently used entry if full"""
+        with self._lock:
+            self._entries[key] = (self.timer(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+    
+    def clear(self) -> None:
+        """Remove all entries"""
+        with self._lock:
+            self._entries.clear()
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+
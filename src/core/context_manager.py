@@ -7,6 +7,8 @@ from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass
 import logging
 
+from ..backends import API_BACKENDS
+
 logger = logging.getLogger(__name__)
 
 
@@ -117,13 +119,11 @@ class ContextManager:
         Returns:
             Total token count
         """
-        total = 0
-        for msg in messages:
-            # Add tokens for role and content
-            total += self.estimate_tokens(f"{msg.role}: {msg.content}")
-            # Add overhead for message structure (approximate)
-            total += 4
-        return total
+        return sum(self._message_tokens(msg) for msg in messages)
+    
+    def _message_tokens(self, msg: Message) -> int:
+        """Estimate tokens for one message, including structural overhead"""
+        return self.estimate_tokens(f"{msg.role}: {msg.content}") + 4
     
     def build_context(self, messages: List[Message], model: Optional[str] = None,
                      system_prompt: Optional[str] = None) -> Tuple[List[Message], Dict[str, Any]]:
@@ -177,7 +177,7 @@ class ContextManager:
         
         for i in range(len(messages) - 1, -1, -1):
             msg = messages[i]
-            msg_tokens = self.estimate_tokens(f"{msg.role}: {msg.content}") + 4
+            msg_tokens = self._message_tokens(msg)
             
             if tokens_used + msg_tokens <= available_tokens * self.compression_threshold:
                 recent_messages.insert(0, msg)
@@ -270,7 +270,7 @@ class ContextManager:
         Returns:
             Formatted messages in backend-specific format
         """
-        if backend_type in ["openai", "anthropic", "google", "mistral-ai", "cohere", "groq"]:
+        if backend_type in API_BACKENDS:
             # OpenAI-style format (list of dicts with role and content)
             formatted = []
             for msg in messages:
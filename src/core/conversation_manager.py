@@ -5,7 +5,7 @@ Conversation Manager - handles saving, loading, and managing chat conversations
 import json
 import uuid
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Iterator
 from datetime import datetime
 import logging
 
@@ -391,6 +391,37 @@ class ConversationManager:
         
         return None
     
+    def export_conversation_iter(self, conv_id: str) -> Optional[Iterator[str]]:
+        """
+        Export a conversation as JSON, one message at a time
+        
+        The stored conversation is still loaded in full, so peak memory
+        stays proportional to its size; only the serialized output is
+        produced in pieces instead of as one string.
+        
+        Args:
+            conv_id: Conversation ID
+        
+        Returns:
+            Iterator of JSON text fragments that join into the conversation
+            object, or None if the conversation does not exist
+        """
+        conversation = self.get_conversation(conv_id)
+        if not conversation:
+            return None
+        return self._iter_conversation_json(conversation)
+    
+    @staticmethod
+    def _iter_conversation_json(conversation: Dict[str, Any]) -> Iterator[str]:
+        """Yield a conversation's JSON encoding in per-message fragments"""
+        header = {k: v for k, v in conversation.items() if k != "messages"}
+        head = json.dumps(header, ensure_ascii=False)
+        # Reopen the header object and splice the messages array into it
+        yield head[:-1] + (", " if header else "") + '"messages": ['
+        for i, msg in enumerate(conversation.get("messages", [])):
+            yield ("," if i else "") + json.dumps(msg, ensure_ascii=False)
+        yield "]}"
+    
     def import_conversation(self, data: Dict[str, Any]) -> Optional[str]:
         """
         Import a conversation from a dictionary
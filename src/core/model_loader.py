@@ -2,21 +2,13 @@
 Model loader - manages different backends and models
 """
 
-from typing import Dict, Optional, List
+from typing import Dict, Optional, List, Type
 from pathlib import Path
+import importlib
 import logging
 import json
 
 from ..backends.base import BaseBackend, ModelResponse
-from ..backends.ollama import OllamaBackend
-from ..backends.openai import OpenAIBackend
-from ..backends.anthropic import AnthropicBackend
-from ..backends.google import GoogleBackend
-from ..backends.mistral_ai import MistralAIBackend
-from ..backends.cohere import CohereBackend
-from ..backends.groq import GroqBackend
-from ..backends.transformers import TransformersBackend
-from ..backends.gguf import GGUFBackend
 from ..utils.config import ConfigManager, LocalMindConfig
 from .tool_registry import ToolRegistry
 from .tool_executor import ToolExecutor
@@ -26,6 +18,28 @@ from .model_manager import ModelManager
 
 logger = logging.getLogger(__name__)
 
+# Backend type -> (module in src.backends, class name, hint logged when unavailable).
+# Modules are imported only for enabled backends, so optional heavy
+# dependencies (torch, llama-cpp) are not loaded unless configured.
+_BACKEND_CLASSES = {
+    "ollama": ("ollama", "OllamaBackend", ""),
+    "openai": ("openai", "OpenAIBackend", " (check API key)"),
+    "anthropic": ("anthropic", "AnthropicBackend", " (check API key)"),
+    "google": ("google", "GoogleBackend", " (check API key)"),
+    "mistral-ai": ("mistral_ai", "MistralAIBackend", " (check API key)"),
+    "cohere": ("cohere", "CohereBackend", " (check API key)"),
+    "groq": ("groq", "GroqBackend", " (check API key)"),
+    "transformers": ("transformers", "TransformersBackend", " (transformers library may not be installed)"),
+    "gguf": ("gguf", "GGUFBackend", " (llama-cpp-python may not be installed)"),
+}
+
+
+def _load_backend_class(backend_type: str) -> Type[BaseBackend]:
+    """Import and return the backend class for a backend type"""
+    module_name, class_name, _ = _BACKEND_CLASSES[backend_type]
+    module = importlib.import_module(f"..backends.{module_name}", __package__)
+    return getattr(module, class_name)
+
 
 class ModelLoader:
     """Manages model backends and loading"""
@@ -57,70 +71,18 @@ class ModelLoader:
             if not backend_config.enabled:
                 continue
             
+            if backend_config.type not in _BACKEND_CLASSES:
+                continue
+            
             try:
-                if backend_config.type == "ollama":
-                    backend = OllamaBackend(backend_config.settings)
-                    if backend.is_available():
-                        self.backends[backend_name] = backend
-                        logger.info(f"✅ Backend '{backend_name}' initialized")
-                    else:
-                        logger.warning(f"⚠️  Backend '{backend_name}' not available")
-                elif backend_config.type == "openai":
-                    backend = OpenAIBackend(backend_config.settings)
-                    if backend.is_available():
-                        self.backends[backend_name] = backend
-                        logger.info(f"✅ Backend '{backend_name}' initialized")
-                    else:
-                        logger.warning(f"⚠️  Backend '{backend_name}' not available (check API key)")
-                elif backend_config.type == "anthropic":
-                    backend = AnthropicBackend(backend_config.settings)
-                    if backend.is_available():
-                        self.backends[backend_name] = backend
-                        logger.info(f"✅ Backend '{backend_name}' initialized")
-                    else:
-                        logger.warning(f"⚠️  Backend '{backend_name}' not available (check API key)")
-                elif backend_config.type == "google":
-                    backend = GoogleBackend(backend_config.settings)
-                    if backend.is_available():
-                        self.backends[backend_name] = backend
-                        logger.info(f"✅ Backend '{backend_name}' initialized")
-                    else:
-                        logger.warning(f"⚠️  Backend '{backend_name}' not available (check API key)")
-                elif backend_config.type == "mistral-ai":
-                    backend = MistralAIBackend(backend_config.settings)
-                    if backend.is_available():
-                        self.backends[backend_name] = backend
-                        logger.info(f"✅ Backend '{backend_name}' initialized")
-                    else:
-                        logger.warning(f"⚠️  Backend '{backend_name}' not available (check API key)")
-                elif backend_config.type == "cohere":
-                    backend = CohereBackend(backend_config.settings)
-                    if backend.is_available():
-                        self.backends[backend_name] = backend
-                        logger.info(f"✅ Backend '{backend_name}' initialized")
-                    else:
-                        logger.warning(f"⚠️  Backend '{backend_name}' not available (check API key)")
-                elif backend_config.type == "groq":
-                    backend = GroqBackend(backend_config.settings)
-                    if backend.is_available():
-                        self.backends[backend_name] = backend
-                        logger.info(f"✅ Backend '{backend_name}' initialized")
-                    else:
-                        logger.warning(f"⚠️  Backend '{backend_name}' not available (check API key)")
-                elif backend_config.type == "transformers":
-                    backend = TransformersBackend(backend_config.settings)
-                    if backend.is_available():
-                        self.backends[backend_name] = backend
-                        logger.info(f"✅ Backend '{backend_name}' initialized")
-                    else:
-                        logger.warning(f"⚠️  Backend '{backend_name}' not available (transformers library may not be installed)")
-                elif backend_config.type == "gguf":
-                    backend = GGUFBackend(backend_config.settings)
-                    if backend.is_available():
-                        self.backends[backend_name] = backend
-                        logger.info(f"✅ Backend '{backend_name}' initialized")
-                    else:
-                        logger.warning(f"⚠️  Backend '{backend_name}' not available (llama-cpp-python may not be installed)")
+                backend_class = _load_backend_class(backend_config.type)
+                backend = backend_class(backend_config.settings)
+                if backend.is_available():
+                    self.backends[backend_name] = backend
+                    logger.info(f"✅ Backend '{backend_name}' initialized")
+                else:
+                    hint = _BACKEND_CLASSES[backend_config.type][2]
+                    logger.warning(f"⚠️  Backend '{backend_name}' not available{hint}")
             except Exception as e:
                 logger.error(f"❌ Failed to initialize backend '{backend_name}': {e}")
     
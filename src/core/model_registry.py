@@ -9,26 +9,33 @@ from typing import Dict, List, Optional, Any
 import logging
 from datetime import datetime, timedelta
 
+from ..backends import API_BACKENDS
+
 logger = logging.getLogger(__name__)
 
 
 class ModelRegistry:
     """Manages model metadata and information for multiple backends"""
     
-    def __init__(self, registry_path: Optional[Path] = None):
+    def __init__(self, registry_path: Optional[Path] = None, in_memory: bool = False):
         """
         Initialize model registry
         
         Args:
             registry_path: Path to store model registry (default: models/registry.json)
+            in_memory: Keep the registry in memory only, never reading or writing registry_path
         """
         if registry_path is None:
             # Use project root models directory
             registry_path = Path(__file__).parent.parent.parent / "models" / "registry.json"
         
         self.registry_path = registry_path
-        self.registry_path.parent.mkdir(parents=True, exist_ok=True)
-        self.registry: Dict[str, Any] = self._load_registry()
+        self.in_memory = in_memory
+        if in_memory:
+            self.registry: Dict[str, Any] = {"backends": {}, "models": {}, "last_updated": None}
+        else:
+            self.registry_path.parent.mkdir(parents=True, exist_ok=True)
+            self.registry = self._load_registry()
     
     def _load_registry(self) -> Dict[str, Any]:
         """Load registry from file"""
@@ -43,6 +50,8 @@ class ModelRegistry:
     
     def _save_registry(self):
         """Save registry to file"""
+        if self.in_memory:
+            return
         try:
             with open(self.registry_path, 'w') as f:
                 json.dump(self.registry, f, indent=2)
@@ -321,7 +330,7 @@ class ModelRegistry:
                 result = self._check_ollama_update(model_name, backend_instance)
             elif backend_name == "transformers":
                 result = self._check_transformers_update(model_name)
-            elif backend_name in ["openai", "anthropic", "google", "mistral-ai", "cohere", "groq"]:
+            elif backend_name in API_BACKENDS:
                 result = self._check_api_model_update(backend_name, model_name)
             else:
                 result["error"] = f"Update checking not supported for backend: {backend_name}"
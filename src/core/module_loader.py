@@ -131,20 +131,22 @@ class ModuleLoader:
                 modules_info.append(info)
         return modules_info
     
-    def find_module_for_prompt(self, prompt: str, context: Optional[Dict[str, Any]] = None) -> Optional[BaseModule]:
+    def find_module_for_prompt(self, prompt: str, context: Optional[Dict[str, Any]] = None,
+                               exclude: Optional[str] = None) -> Optional[BaseModule]:
         """
         Find the best module to handle a prompt
         
         Args:
             prompt: User prompt
             context: Optional context
+            exclude: Module name to skip (already checked by the caller)
         
         Returns:
             Module that can handle the prompt, or None
         """
         # Check each enabled module
         for name, module in self.modules.items():
-            if not module.is_enabled():
+            if name == exclude or not module.is_enabled():
                 continue
             
             try:
@@ -209,17 +211,20 @@ class ModuleLoader:
             ModuleResponse
         """
         # If preferred module specified, try that first
+        checked = None
         if preferred_module:
             module = self.get_module(preferred_module)
             if module and module.is_enabled():
                 try:
                     if module.can_handle(prompt, context):
                         return module.process(prompt, model_loader=model_loader, context=context, **kwargs)
+                    # Declined cleanly - no need to probe it again below
+                    checked = preferred_module
                 except Exception as e:
                     logger.error(f"Error in preferred module {preferred_module}: {e}")
         
         # Find best module for prompt
-        module = self.find_module_for_prompt(prompt, context)
+        module = self.find_module_for_prompt(prompt, context, exclude=checked)
         
         if module:
             return module.process(prompt, model_loader=model_loader, context=context, **kwargs)
@@ -4,6 +4,7 @@ Handles loading and validation of configuration files
 """
 
 import os
+import threading
 from pathlib import Path
 from typing import Optional, Dict, Any
 from pydantic import BaseModel, Field
@@ -69,6 +70,8 @@ class ConfigManager:
         
         self.config_path = config_path
         self.config: Optional[LocalMindConfig] = None
+        # save_config truncates before writing, so concurrent saves must not interleave
+        self._save_lock = threading.Lock()
         self._load_config()
     
     def _load_config(self) -> None:
@@ -353,25 +356,26 @@ class ConfigManager:
     def save_config(self) -> None:
         """Save configuration to file"""
         if self.config:
-            self.config_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            # Convert config to dict and handle Path objects
-            config_dict = self.config.dict()
-            
-            # Convert Path objects to strings for YAML serialization
-            def convert_paths(obj):
-                if isinstance(obj, Path):
-                    return str(obj)
-                elif isinstance(obj, dict):
-                    return {k: convert_paths(v) for k, v in obj.items()}
-                elif isinstance(obj, list):
-                    return [convert_paths(item) for item in obj]
-                return obj
-            
-            config_dict = convert_paths(config_dict)
-            
-            with open(self.config_path, 'w', encoding='utf-8') as f:
-                yaml.dump(config_dict, f, default_flow_style=False, sort_keys=False, allow_unicode=True)
+            with self._save_lock:
+                self.config_path.parent.mkdir(parents=True, exist_ok=True)
+                
+                # Convert config to dict and handle Path objects
+                config_dict = self.config.dict()
+                
+                # Convert Path objects to strings for YAML serialization
+                def convert_paths(obj):
+                    if isinstance(obj, Path):
+                        return str(obj)
+                    elif isinstance(obj, dict):
+                        return {k: convert_paths(v) for k, v in obj.items()}
+                    elif isinstance(obj, list):
+                        return [convert_paths(item) for item in obj]
+                    return obj
+                
+                config_dict = convert_paths(config_dict)
+                
+                with open(self.config_path, 'w', encoding='utf-8') as f:
+                    yaml.dump(config_dict, f, default_flow_style=False, sort_keys=False, allow_unicode=True)
     
     def get_config(self) -> LocalMindConfig:
         """Get current configuration"""
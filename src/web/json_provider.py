@@ -0,0 +1,44 @@
+"""
+orjson-backed JSON provider for Flask
+Faster encoding/decoding for jsonify() and request.get_json()
+"""
+
+from decimal import Decimal
+from pathlib import Path
+from typing import Any
+
+import orjson
+from flask.json.provider import JSONProvider
+
+_DUMPS_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+
+def _default(obj: Any) -> Any:
+    """Encode types orjson does not handle natively"""
+    if isinstance(obj, (Decimal, Path)):
+        return str(obj)
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    if hasattr(obj, "__html__"):
+        return str(obj.__html__())
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class OrjsonProvider(JSONProvider):
+    """JSON provider using orjson instead of the stdlib json module"""
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        """Serialize obj to a JSON string"""
+        return orjson.dumps(obj, default=_default, option=_DUMPS_OPTIONS).decode("utf-8")
+
+    def loads(self, s: Any, **kwargs: Any) -> Any:
+        """Deserialize a JSON str or bytes"""
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any):
+        """Build a JSON response without the bytes -> str -> bytes round trip"""
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            orjson.dumps(obj, default=_default, option=_DUMPS_OPTIONS),
+            mimetype="application/json"
+        )
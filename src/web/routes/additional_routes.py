@@ -342,7 +342,7 @@ def setup_additional_routes(app: Flask, server_instance):
             config = server_instance.config_manager.get_config()
             config.local_only_mode = enabled
             server_instance.config_manager.config = config
-            server_instance.config_manager.save_config()
+            server_instance.schedule_config_save()
             
             # Audit log
             from ...core.audit_logger import AuditEventType
@@ -2,8 +2,9 @@
 Base utilities for routes
 """
 
-from typing import Dict, Any, Tuple
+from typing import Dict, Any, Tuple, Optional
 from pathlib import Path
+from flask import request
 
 
 def success_response(data: Dict[str, Any] = None, message: str = None) -> Dict[str, Any]:
@@ -70,6 +71,18 @@ def error_response(
     return response
 
 
+def get_json_body() -> Optional[Any]:
+    """
+    Parse the current request's JSON body
+    
+    Decoding goes through the app's JSON provider (orjson when installed).
+    
+    Returns:
+        Decoded JSON body, or None if the request has no valid JSON body
+    """
+    return request.get_json(silent=True)
+
+
 def get_project_root() -> Path:
     """Get project root directory"""
     return Path(__file__).parent.parent.parent.parent
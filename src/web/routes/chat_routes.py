@@ -2,18 +2,76 @@
 Chat routes - Handle chat and conversation endpoints
 """
 
-from typing import Dict, Any, Tuple
-from flask import Flask, request, jsonify, Response, stream_with_context
+from typing import Dict, Any, Iterator, List, Optional, Tuple, Union
+from flask import Flask, current_app, request, jsonify, Response, stream_with_context
 import logging
 import time
 import json
-import requests
+import zlib
 
-from .base import error_response, success_response, get_project_root
+from ...backends import API_BACKENDS
+from ...core.audit_logger import AuditEventType
+from ...core.context_manager import Message
+from ...core.webhook_manager import WebhookEvent
+from .base import error_response, success_response, get_project_root, get_json_body
 
 logger = logging.getLogger(__name__)
 
 
+def _sse_event(payload: Dict[str, Any]) -> str:
+    """Frame a payload as an SSE data event using the app's JSON provider"""
+    return f"data: {current_app.json.dumps(payload)}\n\n"
+
+
+def _gzip_stream(chunks: Iterator[Union[str, bytes]]) -> Iterator[bytes]:
+    """
+    Gzip an SSE stream, flushing after every event
+    
+    Z_SYNC_FLUSH keeps each event decodable as soon as it arrives, so the
+    client still sees tokens incrementally. Level 1 keeps CPU cost low.
+    """
+    compressor = zlib.compressobj(1, zlib.DEFLATED, 31)
+    for chunk in chunks:
+        if isinstance(chunk, str):
+            chunk = chunk.encode("utf-8")
+        yield compressor.compress(chunk) + compressor.flush(zlib.Z_SYNC_FLUSH)
+    yield compressor.flush()
+
+
+def _extract_final_system_prompt(processed_messages: List[Message], system_prompt: Optional[str]) -> Optional[str]:
+    """
+    Combine the caller's system prompt with the context summary, if any
+    
+    build_context() inserts at most one summary message, so the scan stops
+    at the first match.
+    """
+    summary = next(
+        (m.content for m in processed_messages
+         if m.role == "system" and m.content.startswith("[Previous conversation summary:")),
+        None
+    )
+    if not summary:
+        return system_prompt
+    return f"{system_prompt}\n\n{summary}" if system_prompt else summary
+
+
+def _prepare_ollama_payload(processed_messages: List[Message], system_prompt: Optional[str],
+                            model: str, prompt_text: str, temperature: float) -> Dict[str, Any]:
+    """Build the streaming /api/generate payload for Ollama"""
+    payload = {
+        "model": model,
+        "prompt": prompt_text,
+        "stream": True,
+        "options": {"temperature": temperature}
+    }
+    
+    final_system_prompt = _extract_final_system_prompt(processed_messages, system_prompt)
+    if final_system_prompt:
+        payload["system"] = final_system_prompt
+    
+    return payload
+
+
 def setup_chat_routes(app: Flask, server_instance):
     """
     Setup chat-related routes
@@ -31,8 +89,6 @@ def setup_chat_routes(app: Flask, server_instance):
         # Rate limiting
         client_ip = request.remote_addr or "unknown"
         is_allowed, error_msg = server_instance.rate_limiter.is_allowed(client_ip)
-        # Audit log
-        from ...core.audit_logger import AuditEventType
         
         if not is_allowed:
             server_instance.audit_logger.log(
@@ -49,7 +105,7 @@ def setup_chat_routes(app: Flask, server_instance):
         )
         
         try:
-            data = request.get_json()
+            data = get_json_body() or {}
             prompt = data.get("prompt")
             model = data.get("model")
             system_prompt = data.get("system_prompt")
@@ -81,7 +137,6 @@ def setup_chat_routes(app: Flask, server_instance):
                 conversation_messages = conversation.get("messages", [])
             
             # Convert to Message objects
-            from ...core.context_manager import Message
             history_messages = server_instance.context_manager.get_conversation_history(conversation_messages)
             
             # Add current user message
@@ -106,7 +161,7 @@ def setup_chat_routes(app: Flask, server_instance):
                     temperature=temperature
                 )
             except Exception as e:
-                logger.warning(f"Module processing failed: {e}")
+                logger.warning("Module processing failed: %s", e)
                 module_response = None
             
             # If module handled it, use module response
@@ -148,7 +203,6 @@ def setup_chat_routes(app: Flask, server_instance):
             if backend_name:
                 is_allowed, error_msg = server_instance.local_only_mode.is_allowed(backend_name)
                 if not is_allowed:
-                    from ...core.audit_logger import AuditEventType
                     server_instance.audit_logger.log(
                         AuditEventType.SECURITY_VIOLATION,
                         ip_address=client_ip,
@@ -158,11 +212,11 @@ def setup_chat_routes(app: Flask, server_instance):
                     return jsonify(error_response(error_msg, status_code=403, error_type="local_only_mode")), 403
             
             # Format messages for backend
-            if backend_type in ["openai", "anthropic", "google", "mistral-ai", "cohere", "groq"]:
+            if backend_type in API_BACKENDS:
                 formatted_messages = server_instance.context_manager.format_messages_for_backend(
                     processed_messages, backend_type
                 )
-                prompt_text = "\n".join([f"{m['role']}: {m['content']}" for m in formatted_messages if m.get('role') != 'system'])
+                prompt_text = "\n".join(f"{m['role']}: {m['content']}" for m in formatted_messages if m.get('role') != 'system')
             else:
                 prompt_text = server_instance.context_manager.format_messages_for_backend(
                     processed_messages, "ollama"
@@ -185,7 +239,6 @@ def setup_chat_routes(app: Flask, server_instance):
                 )
             
             # Trigger webhook
-            from ...core.webhook_manager import WebhookEvent
             server_instance.webhook_manager.trigger_webhook(
                     WebhookEvent.CHAT_MESSAGE,
                     {
@@ -203,43 +256,34 @@ def setup_chat_routes(app: Flask, server_instance):
                         # Get the appropriate backend
                         backend = server_instance.model_loader.backends.get(backend_name)
                         if not backend:
-                            yield f"data: {json.dumps({'error': f'Backend {backend_name} not available'})}\n\n"
+                            yield _sse_event({'error': f'Backend {backend_name} not available'})
                             return
                         
                         # For Ollama, use direct API call
                         if backend_type == "ollama":
                             url = f"{backend.base_url}/api/generate"
-                            payload = {
-                                "model": model or server_instance.config_manager.get_config().default_model,
-                                "prompt": prompt_text,
-                                "stream": True,
-                                "options": {"temperature": temperature}
-                            }
-                            
-                            final_system_prompt = system_prompt
-                            for msg in processed_messages:
-                                if msg.role == "system" and "[Previous conversation summary:" in msg.content:
-                                    if final_system_prompt:
-                                        final_system_prompt = f"{final_system_prompt}\n\n{msg.content}"
-                                    else:
-                                        final_system_prompt = msg.content
-                            
-                            if final_system_prompt:
-                                payload["system"] = final_system_prompt
+                            payload = _prepare_ollama_payload(
+                                processed_messages,
+                                system_prompt,
+                                model or server_instance.config_manager.get_config().default_model,
+                                prompt_text,
+                                temperature
+                            )
                             
-                            full_response = ""
+                            response_parts = []
                             try:
-                                with requests.post(url, json=payload, stream=True, timeout=getattr(backend, 'timeout', 300)) as r:
+                                with backend.session.post(url, json=payload, stream=True, timeout=getattr(backend, 'timeout', 300)) as r:
                                     r.raise_for_status()
                                     for line in r.iter_lines():
                                         if line:
                                             try:
-                                                data = json.loads(line)
+                                                data = app.json.loads(line)
                                                 if "response" in data:
                                                     chunk = data['response']
-                                                    full_response += chunk
-                                                    yield f"data: {json.dumps({'chunk': chunk})}\n\n"
+                                                    response_parts.append(chunk)
+                                                    yield _sse_event({'chunk': chunk})
                                                 if data.get("done", False):
+                                                    full_response = "".join(response_parts)
                                                     # Save assistant message
                                                     server_instance.conversation_manager.save_message(
                                                         conv_id,
@@ -249,7 +293,6 @@ def setup_chat_routes(app: Flask, server_instance):
                                                     )
                                                     
                                                     # Trigger webhook
-                                                    from ...core.webhook_manager import WebhookEvent
                                                     server_instance.webhook_manager.trigger_webhook(
                                                         WebhookEvent.CHAT_COMPLETE,
                                                         {
@@ -260,17 +303,17 @@ def setup_chat_routes(app: Flask, server_instance):
                                                         }
                                                     )
                                                     
-                                                    yield f"data: {json.dumps({'done': True, 'conversation_id': conv_id})}\n\n"
+                                                    yield _sse_event({'done': True, 'conversation_id': conv_id})
                                                     break
                                             except (json.JSONDecodeError, UnicodeDecodeError):
                                                 continue
                             except Exception as e:
-                                logger.error(f"Ollama streaming error: {e}")
-                                yield f"data: {json.dumps({'error': str(e)})}\n\n"
+                                logger.error("Ollama streaming error: %s", e)
+                                yield _sse_event({'error': str(e)})
                         else:
                             # For other backends, use the backend's generate method with streaming
                             # Fallback to non-streaming for now if backend doesn't support streaming
-                            logger.warning(f"Streaming not fully supported for {backend_type}, using non-streaming")
+                            logger.warning("Streaming not fully supported for %s, using non-streaming", backend_type)
                             response = backend.generate(
                                 prompt=prompt_text,
                                 model=model,
@@ -284,7 +327,7 @@ def setup_chat_routes(app: Flask, server_instance):
                             chunk_size = 10
                             for i in range(0, len(text), chunk_size):
                                 chunk = text[i:i+chunk_size]
-                                yield f"data: {json.dumps({'chunk': chunk})}\n\n"
+                                yield _sse_event({'chunk': chunk})
                             
                             # Save assistant message
                             server_instance.conversation_manager.save_message(
@@ -295,7 +338,6 @@ def setup_chat_routes(app: Flask, server_instance):
                             )
                             
                             # Trigger webhook
-                            from ...core.webhook_manager import WebhookEvent
                             server_instance.webhook_manager.trigger_webhook(
                                 WebhookEvent.CHAT_COMPLETE,
                                 {
@@ -306,12 +348,19 @@ def setup_chat_routes(app: Flask, server_instance):
                                 }
                             )
                             
-                            yield f"data: {json.dumps({'done': True, 'conversation_id': conv_id})}\n\n"
+                            yield _sse_event({'done': True, 'conversation_id': conv_id})
                     except Exception as e:
-                        logger.error(f"Streaming error: {e}", exc_info=True)
-                        yield f"data: {json.dumps({'error': str(e)})}\n\n"
+                        logger.error("Streaming error: %s", e, exc_info=True)
+                        yield _sse_event({'error': str(e)})
+                
+                # Vary on both branches so caches never serve gzip to a client that did not ask
+                headers = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no", "Vary": "Accept-Encoding"}
+                body = generate()
+                if request.accept_encodings["gzip"]:
+                    body = _gzip_stream(body)
+                    headers["Content-Encoding"] = "gzip"
                 
-                return Response(stream_with_context(generate()), mimetype='text/event-stream')
+                return Response(stream_with_context(body), mimetype='text/event-stream', headers=headers)
             else:
                 # Non-streaming response
                 backend = server_instance.model_loader.backends.get(backend_name)
@@ -380,7 +429,7 @@ def setup_chat_routes(app: Flask, server_instance):
                 }))
         
         except Exception as e:
-            logger.error(f"Error in chat: {e}", exc_info=True)
+            logger.error("Error in chat: %s", e, exc_info=True)
             
             response_time = time.time() - start_time
             backend_name, _ = server_instance._get_backend_for_model(model)
@@ -7,11 +7,98 @@ from flask import Flask, request, jsonify, send_file
 from pathlib import Path
 import logging
 import os
+from types import MappingProxyType
 
-from .base import error_response, success_response, get_project_root
+from .base import error_response, success_response, get_project_root, get_json_body
 
 logger = logging.getLogger(__name__)
 
+# Chat API providers shown on the configure page
+_PROVIDER_INFO = MappingProxyType({
+    "openai": {
+        "display_name": "OpenAI (ChatGPT)",
+        "setup_url": "https://platform.openai.com/api-keys",
+        "env_var": "OPENAI_API_KEY"
+    },
+    "anthropic": {
+        "display_name": "Anthropic (Claude)",
+        "setup_url": "https://console.anthropic.com/",
+        "env_var": "ANTHROPIC_API_KEY"
+    },
+    "google": {
+        "display_name": "Google (Gemini)",
+        "setup_url": "https://makersuite.google.com/app/apikey",
+        "env_var": "GOOGLE_API_KEY"
+    },
+    "mistral-ai": {
+        "display_name": "Mistral AI",
+        "setup_url": "https://console.mistral.ai/",
+        "env_var": "MISTRAL_AI_API_KEY"
+    },
+    "cohere": {
+        "display_name": "Cohere",
+        "setup_url": "https://dashboard.cohere.com/api-keys",
+        "env_var": "COHERE_API_KEY"
+    },
+    "groq": {
+        "display_name": "Groq (Fast Inference)",
+        "setup_url": "https://console.groq.com/keys",
+        "env_var": "GROQ_API_KEY"
+    }
+})
+
+# Video generation providers shown on the configure page
+_VIDEO_PROVIDER_INFO = MappingProxyType({
+    "sora": {
+        "display_name": "OpenAI Sora",
+        "setup_url": "https://platform.openai.com/api-keys",
+        "env_var": "OPENAI_API_KEY",
+        "description": "OpenAI's original Sora text-to-video model"
+    },
+    "sora2": {
+        "display_name": "OpenAI Sora 2",
+        "setup_url": "https://platform.openai.com/api-keys",
+        "env_var": "OPENAI_API_KEY",
+        "description": "OpenAI's Sora 2 - Enhanced video generation with synchronized audio and cinematic controls"
+    },
+    "runway": {
+        "display_name": "Runway ML",
+        "setup_url": "https://app.runwayml.com/api/settings",
+        "env_var": "RUNWAY_API_KEY",
+        "description": "Runway Gen-3 and Gen-2 video generation"
+    },
+    "pika": {
+        "display_name": "Pika Labs",
+        "setup_url": "https://pika.art/",
+        "env_var": "PIKA_API_KEY",
+        "description": "Pika Labs video generation"
+    },
+    "stability": {
+        "display_name": "Stability AI",
+        "setup_url": "https://platform.stability.ai/account/api-keys",
+        "env_var": "STABILITY_API_KEY",
+        "description": "Stable Video Diffusion models"
+    },
+    "kling": {
+        "display_name": "Kling AI",
+        "setup_url": "https://klingai.com/",
+        "env_var": "KLING_API_KEY",
+        "description": "Kling AI video generation"
+    },
+    "luma": {
+        "display_name": "Luma AI",
+        "setup_url": "https://lumalabs.ai/",
+        "env_var": "LUMA_API_KEY",
+        "description": "Luma Dream Machine video generation"
+    },
+    "haiper": {
+        "display_name": "Haiper",
+        "setup_url": "https://haiper.ai/",
+        "env_var": "HAIPER_API_KEY",
+        "description": "Haiper AI video generation"
+    }
+})
+
 
 def setup_config_routes(app: Flask, server_instance):
     """
@@ -54,7 +141,7 @@ def setup_config_routes(app: Flask, server_instance):
             config.disable_safety_filters = disable_safety_filters
             
             server_instance.config_manager.config = config
-            server_instance.config_manager.save_config()
+            server_instance.schedule_config_save()
             
             return jsonify(success_response({
                 "unrestricted_mode": unrestricted_mode,
@@ -71,40 +158,7 @@ def setup_config_routes(app: Flask, server_instance):
             config = server_instance.config_manager.get_config()
             providers = []
             
-            provider_info = {
-                "openai": {
-                    "display_name": "OpenAI (ChatGPT)",
-                    "setup_url": "https://platform.openai.com/api-keys",
-                    "env_var": "OPENAI_API_KEY"
-                },
-                "anthropic": {
-                    "display_name": "Anthropic (Claude)",
-                    "setup_url": "https://console.anthropic.com/",
-                    "env_var": "ANTHROPIC_API_KEY"
-                },
-                "google": {
-                    "display_name": "Google (Gemini)",
-                    "setup_url": "https://makersuite.google.com/app/apikey",
-                    "env_var": "GOOGLE_API_KEY"
-                },
-                "mistral-ai": {
-                    "display_name": "Mistral AI",
-                    "setup_url": "https://console.mistral.ai/",
-                    "env_var": "MISTRAL_AI_API_KEY"
-                },
-                "cohere": {
-                    "display_name": "Cohere",
-                    "setup_url": "https://dashboard.cohere.com/api-keys",
-                    "env_var": "COHERE_API_KEY"
-                },
-                "groq": {
-                    "display_name": "Groq (Fast Inference)",
-                    "setup_url": "https://console.groq.com/keys",
-                    "env_var": "GROQ_API_KEY"
-                }
-            }
-            
-            for name, info in provider_info.items():
+            for name, info in _PROVIDER_INFO.items():
                 backend_config = config.backends.get(name)
                 # Check encrypted storage first, then env, then config
                 api_key = server_instance.key_manager.decrypt_key(name) or os.getenv(info["env_var"]) or (backend_config.settings.get("api_key", "") if backend_config else "")
@@ -128,7 +182,7 @@ def setup_config_routes(app: Flask, server_instance):
     def api_save_provider():
         """Save provider configuration"""
         try:
-            data = request.get_json()
+            data = get_json_body()
             if not data:
                 return jsonify(error_response("No data provided", status_code=400, error_type="validation")), 400
             
@@ -160,7 +214,7 @@ def setup_config_routes(app: Flask, server_instance):
             backend_config.enabled = enabled
             
             server_instance.config_manager.config = config
-            server_instance.config_manager.save_config()
+            server_instance.schedule_config_save()
             
             # Audit log
             from ...core.audit_logger import AuditEventType
@@ -250,58 +304,7 @@ def setup_config_routes(app: Flask, server_instance):
             config = server_instance.config_manager.get_config()
             providers = []
             
-            video_provider_info = {
-                "sora": {
-                    "display_name": "OpenAI Sora",
-                    "setup_url": "https://platform.openai.com/api-keys",
-                    "env_var": "OPENAI_API_KEY",
-                    "description": "OpenAI's original Sora text-to-video model"
-                },
-                "sora2": {
-                    "display_name": "OpenAI Sora 2",
-                    "setup_url": "https://platform.openai.com/api-keys",
-                    "env_var": "OPENAI_API_KEY",
-                    "description": "OpenAI's Sora 2 - Enhanced video generation with synchronized audio and cinematic controls"
-                },
-                "runway": {
-                    "display_name": "Runway ML",
-                    "setup_url": "https://app.runwayml.com/api/settings",
-                    "env_var": "RUNWAY_API_KEY",
-                    "description": "Runway Gen-3 and Gen-2 video generation"
-                },
-                "pika": {
-                    "display_name": "Pika Labs",
-                    "setup_url": "https://pika.art/",
-                    "env_var": "PIKA_API_KEY",
-                    "description": "Pika Labs video generation"
-                },
-                "stability": {
-                    "display_name": "Stability AI",
-                    "setup_url": "https://platform.stability.ai/account/api-keys",
-                    "env_var": "STABILITY_API_KEY",
-                    "description": "Stable Video Diffusion models"
-                },
-                "kling": {
-                    "display_name": "Kling AI",
-                    "setup_url": "https://klingai.com/",
-                    "env_var": "KLING_API_KEY",
-                    "description": "Kling AI video generation"
-                },
-                "luma": {
-                    "display_name": "Luma AI",
-                    "setup_url": "https://lumalabs.ai/",
-                    "env_var": "LUMA_API_KEY",
-                    "description": "Luma Dream Machine video generation"
-                },
-                "haiper": {
-                    "display_name": "Haiper",
-                    "setup_url": "https://haiper.ai/",
-                    "env_var": "HAIPER_API_KEY",
-                    "description": "Haiper AI video generation"
-                }
-            }
-            
-            for name, info in video_provider_info.items():
+            for name, info in _VIDEO_PROVIDER_INFO.items():
                 backend_config = config.video_backends.get(name)
                 # Check encrypted storage first, then env, then config
                 api_key = server_instance.key_manager.decrypt_key(f"video_{name}") or os.getenv(info["env_var"]) or (backend_config.settings.get("api_key", "") if backend_config else "")
@@ -359,7 +362,7 @@ def setup_config_routes(app: Flask, server_instance):
             backend_config.enabled = enabled
             
             server_instance.config_manager.config = config
-            server_instance.config_manager.save_config()
+            server_instance.schedule_config_save()
             
             # Audit log
             from ...core.audit_logger import AuditEventType
@@ -3,13 +3,19 @@ Conversation routes - Handle conversation management endpoints
 """
 
 from typing import Dict, Any, Tuple
-from flask import Flask, request, jsonify
+from flask import Flask, request, jsonify, Response
+import json
 import logging
 
-from .base import error_response, success_response
+from .base import error_response, success_response, get_json_body
 
 logger = logging.getLogger(__name__)
 
+# Responses whose body never changes, serialized once at import
+_JSON_HEADERS = {"Content-Type": "application/json"}
+_UPDATED_BODY = json.dumps(success_response({"message": "Conversation updated"}))
+_DELETED_BODY = json.dumps(success_response({"message": "Conversation deleted"}))
+
 
 def setup_conversation_routes(app: Flask, server_instance):
     """
@@ -52,14 +58,14 @@ def setup_conversation_routes(app: Flask, server_instance):
                 }
             }))
         except Exception as e:
-            logger.error(f"Error listing conversations: {e}")
+            logger.error("Error listing conversations: %s", e)
             return jsonify(error_response(str(e), status_code=500)), 500
     
     @app.route("/api/conversations", methods=["POST"])
     def api_create_conversation():
         """Create a new conversation"""
         try:
-            data = request.get_json() or {}
+            data = get_json_body() or {}
             title = data.get("title")
             model = data.get("model")
             conv_id = server_instance.conversation_manager.create_conversation(title=title, model=model)
@@ -72,7 +78,7 @@ def setup_conversation_routes(app: Flask, server_instance):
             
             return jsonify(success_response({"conversation_id": conv_id}))
         except Exception as e:
-            logger.error(f"Error creating conversation: {e}")
+            logger.error("Error creating conversation: %s", e)
             return jsonify(error_response(str(e), status_code=500)), 500
     
     @app.route("/api/conversations/<conv_id>", methods=["GET"])
@@ -84,14 +90,14 @@ def setup_conversation_routes(app: Flask, server_instance):
                 return jsonify(error_response("Conversation not found", status_code=404, error_type="not_found")), 404
             return jsonify(success_response({"conversation": conversation}))
         except Exception as e:
-            logger.error(f"Error getting conversation: {e}", exc_info=True)
+            logger.error("Error getting conversation: %s", e, exc_info=True)
             return jsonify(error_response(str(e), status_code=500)), 500
     
     @app.route("/api/conversations/<conv_id>", methods=["PUT"])
     def api_update_conversation(conv_id):
         """Update conversation metadata"""
         try:
-            data = request.get_json() or {}
+            data = get_json_body() or {}
             title = data.get("title")
             
             if title:
@@ -103,9 +109,9 @@ def setup_conversation_routes(app: Flask, server_instance):
                 {"conversation_id": conv_id, "updates": data}
             )
             
-            return jsonify(success_response({"message": "Conversation updated"}))
+            return _UPDATED_BODY, 200, _JSON_HEADERS
         except Exception as e:
-            logger.error(f"Error updating conversation: {e}", exc_info=True)
+            logger.error("Error updating conversation: %s", e, exc_info=True)
             return jsonify(error_response(str(e), status_code=500)), 500
     
     @app.route("/api/conversations/<conv_id>", methods=["DELETE"])
@@ -120,9 +126,9 @@ def setup_conversation_routes(app: Flask, server_instance):
                 {"conversation_id": conv_id}
             )
             
-            return jsonify(success_response({"message": "Conversation deleted"}))
+            return _DELETED_BODY, 200, _JSON_HEADERS
         except Exception as e:
-            logger.error(f"Error deleting conversation: {e}", exc_info=True)
+            logger.error("Error deleting conversation: %s", e, exc_info=True)
             return jsonify(error_response(str(e), status_code=500)), 500
     
     @app.route("/api/conversations/<conv_id>/export", methods=["GET"])
@@ -130,6 +136,23 @@ def setup_conversation_routes(app: Flask, server_instance):
         """Export conversation in various formats"""
         try:
             format_type = request.args.get("format", "json")
+            
+            if format_type not in ("markdown", "text"):
+                # Stream JSON exports message by message instead of building one big body
+                export_iter = server_instance.conversation_manager.export_conversation_iter(conv_id)
+                if export_iter is None:
+                    return jsonify(error_response("Conversation not found", status_code=404, error_type="not_found")), 404
+                
+                # Reopen the standard success envelope and splice the conversation into it
+                envelope = app.json.dumps(success_response({"format": "json"}))
+                
+                def generate():
+                    yield envelope[:-1] + ', "conversation": '
+                    yield from export_iter
+                    yield '}'
+                
+                return Response(generate(), mimetype="application/json")
+            
             conversation = server_instance.conversation_manager.get_conversation(conv_id)
             
             if not conversation:
@@ -139,20 +162,18 @@ def setup_conversation_routes(app: Flask, server_instance):
                 from ...core.conversation_importer import ConversationImporter
                 markdown = ConversationImporter.conversation_to_markdown(conversation)
                 return jsonify(success_response({"format": "markdown", "content": markdown}))
-            elif format_type == "text":
+            else:
                 text = "\n\n".join([f"{msg['role']}: {msg['content']}" for msg in conversation.get("messages", [])])
                 return jsonify(success_response({"format": "text", "content": text}))
-            else:
-                return jsonify(success_response({"format": "json", "conversation": conversation}))
         except Exception as e:
-            logger.error(f"Error exporting conversation: {e}", exc_info=True)
+            logger.error("Error exporting conversation: %s", e, exc_info=True)
             return jsonify(error_response(str(e), status_code=500)), 500
     
     @app.route("/api/conversations/import", methods=["POST"])
     def api_import_conversation():
         """Import conversation from various formats"""
         try:
-            data = request.get_json()
+            data = get_json_body()
             if not data:
                 return jsonify(error_response("No data provided", status_code=400, error_type="validation")), 400
             
@@ -175,6 +196,6 @@ def setup_conversation_routes(app: Flask, server_instance):
         except ValueError as e:
             return jsonify(error_response(str(e), status_code=400, error_type="validation")), 400
         except Exception as e:
-            logger.error(f"Error importing conversation: {e}", exc_info=True)
+            logger.error("Error importing conversation: %s", e, exc_info=True)
             return jsonify(error_response(str(e), status_code=500)), 500
 
@@ -6,13 +6,20 @@ from typing import Dict, Any, Tuple
 from flask import Flask, request, jsonify
 from pathlib import Path
 import logging
+import re
 import time
 import threading
 
-from .base import error_response, success_response
+from .base import error_response, success_response, get_json_body
 
 logger = logging.getLogger(__name__)
 
+# Matches the percentage in "ollama pull" progress lines, e.g. "pulling 8eeb52dfb3bb...  42%"
+_PULL_PROGRESS_RE = re.compile(r"(\d{1,3})%")
+
+# Downloads waiting for or running on the download pool before new ones are rejected
+MAX_PENDING_DOWNLOADS = 20
+
 
 def setup_model_routes(app: Flask, server_instance):
     """
@@ -62,7 +69,7 @@ def setup_model_routes(app: Flask, server_instance):
     def api_download_model():
         """Download a model"""
         try:
-            data = request.get_json()
+            data = get_json_body()
             if not data:
                 return jsonify(error_response("No data provided", status_code=400, error_type="validation")), 400
             
@@ -76,18 +83,69 @@ def setup_model_routes(app: Flask, server_instance):
             if not backend_instance:
                 return jsonify(error_response(f"Backend '{backend}' not available", status_code=404)), 404
             
-            # Start download in background
             download_id = f"{backend}_{model_name}_{int(time.time())}"
-            server_instance.download_progress[download_id] = {
-                "status": "starting",
-                "progress": 0,
-                "model": model_name,
-                "backend": backend
-            }
+            # Count and reserve under one lock so concurrent requests cannot overshoot the limit
+            with server_instance.download_lock:
+                pending = sum(
+                    1 for p in server_instance.download_progress.values()
+                    if p.get("status") in ("starting", "downloading")
+                )
+                if pending >= MAX_PENDING_DOWNLOADS:
+                    return jsonify(error_response(
+                        "Too many downloads in progress",
+                        status_code=429,
+                        error_type="rate_limit"
+                    )), 429
+                
+                server_instance.download_progress[download_id] = {
+                    "status": "starting",
+                    "progress": 0,
+                    "model": model_name,
+                    "backend": backend
+                }
             
             def download_thread():
                 try:
                     result = backend_instance.download_model(model_name)
+                    
+                    if not isinstance(result, dict):
+                        result = {"result": result}
+                    process = result.pop("process", None)
+                    if process is not None:
+                        with server_instance.download_lock:
+                            server_instance.download_processes.add(process)
+                        try:
+                            # Progress bars redraw with "\r", so treat it as a line break too
+                            for raw in process.stdout:
+                                for line in raw.replace("\r", "\n").splitlines():
+                                    match = _PULL_PROGRESS_RE.search(line)
+                                    if match:
+                                        server_instance.download_progress[download_id]["progress"] = int(match.group(1))
+                                        server_instance.download_progress[download_id]["status"] = "downloading"
+                            process.wait()
+                        finally:
+                            with server_instance.download_lock:
+                                server_instance.download_processes.discard(process)
+                        if process.returncode != 0:
+                            error = f"ollama pull exited with code {process.returncode}"
+                        else:
+                            error = None
+                    else:
+                        error = result.get("error") if result.get("status") == "error" else None
+                    
+                    if error:
+                        # Expected failure (missing API key, unknown model, ...): no traceback needed
+                        logger.warning(f"Download of {backend}/{model_name} failed: {error}")
+                        server_instance.download_progress[download_id] = {
+                            "status": "error",
+                            "error": error,
+                            "model": model_name,
+                            "backend": backend
+                        }
+                        return
+                    
+                    server_instance.invalidate_backend_cache()
+                    
                     server_instance.download_progress[download_id] = {
                         "status": "completed",
                         "progress": 100,
@@ -102,6 +160,7 @@ def setup_model_routes(app: Flask, server_instance):
                         {"model": model_name, "backend": backend, "download_id": download_id}
                     )
                 except Exception as e:
+                    logger.error(f"Error downloading {backend}/{model_name}: {e}", exc_info=True)
                     server_instance.download_progress[download_id] = {
                         "status": "error",
                         "error": str(e),
@@ -109,10 +168,17 @@ def setup_model_routes(app: Flask, server_instance):
                         "backend": backend
                     }
             
-            import threading
-            thread = threading.Thread(target=download_thread)
-            thread.daemon = True
-            thread.start()
+            def mark_cancelled(future):
+                # Queued downloads dropped at shutdown never run download_thread
+                if future.cancelled():
+                    server_instance.download_progress[download_id] = {
+                        "status": "error",
+                        "error": "Download cancelled at shutdown",
+                        "model": model_name,
+                        "backend": backend
+                    }
+            
+            server_instance.download_pool.submit(download_thread).add_done_callback(mark_cancelled)
             
             return jsonify(success_response({
                 "download_id": download_id,
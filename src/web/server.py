@@ -3,13 +3,22 @@ Web server for LocalMind
 Provides REST API and web interface
 """
 
+import atexit
+import queue
+import re
+import sys
+import threading
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, Optional, Tuple
+from typing import Dict, Any, Optional, Set, Tuple
 from flask import Flask, render_template
 from flask_cors import CORS
 
 from ..core.model_loader import ModelLoader
 from ..core.model_registry import ModelRegistry
+from ..core.cache import LRUCache
 from ..core.conversation_manager import ConversationManager
 from ..core.context_manager import ContextManager
 from ..core.video_loader import VideoLoader
@@ -58,6 +67,47 @@ from .routes import (
 
 logger = setup_logger()
 
+# Seconds a model -> backend lookup stays cached, and how many models to remember
+BACKEND_CACHE_TTL = 300
+BACKEND_CACHE_SIZE = 256
+
+# Substring -> (backend name, backend type) used to guess a model's backend
+# when no backend lists it. Checked in order; the first match wins.
+_MODEL_PREFIX_TABLE = (
+    ("gpt", "openai", "openai"),
+    ("openai", "openai", "openai"),
+    ("claude", "anthropic", "anthropic"),
+    ("anthropic", "anthropic", "anthropic"),
+    ("gemini", "google", "google"),
+    ("google", "google", "google"),
+    ("mistral", "mistral-ai", "mistral-ai"),
+    ("command", "cohere", "cohere"),
+    ("cohere", "cohere", "cohere"),
+    ("groq", "groq", "groq"),
+    ("llama-3", "groq", "groq"),
+    ("mixtral", "groq", "groq"),
+)
+# All prefixes as one alternation so a name is scanned once, plus each prefix's
+# table position so the earliest table entry still wins when several match
+_MODEL_PREFIX_RE = re.compile("|".join(re.escape(prefix) for prefix, _, _ in _MODEL_PREFIX_TABLE))
+_MODEL_PREFIX_LOOKUP = {
+    prefix: (priority, backend_name, backend_type)
+    for priority, (prefix, backend_name, backend_type) in enumerate(_MODEL_PREFIX_TABLE)
+}
+
+# Servers still alive at interpreter exit; held weakly so the exit hook pins none of them
+_live_servers = weakref.WeakSet()
+
+
+def _shutdown_live_servers() -> None:
+    """Write out pending config saves and stop downloads on every live server"""
+    for server in list(_live_servers):
+        server.flush_config_save()
+        server.shutdown_downloads()
+
+
+atexit.register(_shutdown_live_servers)
+
 
 class WebServer:
     """Web server for LocalMind"""
@@ -141,6 +191,14 @@ class WebServer:
         )
         CORS(self.app)
         
+        # Use orjson for JSON encoding/decoding when available
+        try:
+            from .json_provider import OrjsonProvider
+            self.app.json = OrjsonProvider(self.app)
+            logger.info("orjson JSON provider enabled")
+        except ImportError:
+            logger.debug("orjson not installed, using default JSON provider")
+        
         # Enable response compression for better performance
         try:
             from flask_compress import Compress
@@ -170,8 +228,21 @@ class WebServer:
         # Start video queue processor
         self._start_video_queue_processor()
         
+        # Persist config changes off the request thread
+        self._start_config_save_worker()
+        
         # Track download progress
         self.download_progress: Dict[str, Dict[str, Any]] = {}
+        # Bounded worker pool for model downloads
+        self.download_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="download")
+        # Guards download_progress bookkeeping and the running pull processes
+        self.download_lock = threading.Lock()
+        self.download_processes: Set[Any] = set()
+        # Lets the module's exit hook flush config and stop downloads
+        _live_servers.add(self)
+        
+        # Cached model -> (backend_name, backend_type) lookups confirmed by a backend
+        self._backend_cache = LRUCache(maxsize=BACKEND_CACHE_SIZE, ttl=BACKEND_CACHE_TTL)
         
         # Track current conversation per session (simple in-memory store)
         # In production, use Flask sessions
@@ -243,29 +314,30 @@ class WebServer:
         except Exception as e:
             logger.warning(f"Failed to register code execution tool: {e}")
     
+    def _index(self):
+        """Serve main page"""
+        return render_template("index.html")
+    
+    def _configure_page(self):
+        """Serve API configuration page"""
+        return render_template("configure.html")
+    
+    def _video_page(self):
+        """Serve video generation page"""
+        return render_template("video.html")
+    
+    def _code_page(self):
+        """Serve code execution page"""
+        return render_template("code.html")
+    
     def _setup_routes(self):
         """Setup all routes"""
         
-        # Basic page routes
-        @self.app.route("/")
-        def index():
-            """Serve main page"""
-            return render_template("index.html")
-        
-        @self.app.route("/configure")
-        def configure_page():
-            """Serve API configuration page"""
-            return render_template("configure.html")
-        
-        @self.app.route("/video")
-        def video_page():
-            """Serve video generation page"""
-            return render_template("video.html")
-        
-        @self.app.route("/code")
-        def code_page():
-            """Serve code execution page"""
-            return render_template("code.html")
+        # Basic page routes (bound methods, so no per-instance closures)
+        self.app.add_url_rule("/", "index", self._index)
+        self.app.add_url_rule("/configure", "configure_page", self._configure_page)
+        self.app.add_url_rule("/video", "video_page", self._video_page)
+        self.app.add_url_rule("/code", "code_page", self._code_page)
         
         # Setup all route modules
         setup_chat_routes(self.app, self)
@@ -286,7 +358,26 @@ class WebServer:
             debug: Enable Flask debug mode (default: False)
         """
         logger.info(f"Starting LocalMind web server on {self.host}:{self.port}")
-        self.socketio.run(self.app, host=self.host, port=self.port, debug=debug, allow_unsafe_werkzeug=True)
+        try:
+            self.socketio.run(self.app, host=self.host, port=self.port, debug=debug, allow_unsafe_werkzeug=True)
+        finally:
+            # Since 3.9 the pool joins its workers before atexit hooks run, so a
+            # pull still in progress would block exit unless stopped here
+            self.shutdown_downloads()
+    
+    def shutdown_downloads(self) -> None:
+        """Terminate running model pulls and cancel queued downloads"""
+        with self.download_lock:
+            processes = list(self.download_processes)
+        for process in processes:
+            try:
+                process.terminate()
+            except OSError:
+                pass
+        if sys.version_info >= (3, 9):
+            self.download_pool.shutdown(wait=False, cancel_futures=True)
+        else:
+            self.download_pool.shutdown(wait=False)
     
     def _start_video_queue_processor(self):
         """Start background video queue processor"""
@@ -328,17 +419,76 @@ class WebServer:
         cleanup_thread.start()
         logger.info("Video cache cleanup started")
     
+    def _start_config_save_worker(self):
+        """Start background writer that persists config changes"""
+        self._save_queue = queue.Queue(maxsize=1)
+        self._config_save_lock = threading.Lock()
+        self._config_dirty = False
+        
+        def save_worker():
+            while True:
+                self._save_queue.get()
+                # Debounce so rapid successive edits coalesce into one write
+                time.sleep(0.2)
+                self.flush_config_save()
+        
+        save_thread = threading.Thread(target=save_worker, daemon=True)
+        save_thread.start()
+        logger.info("Config save worker started")
+    
+    def schedule_config_save(self) -> None:
+        """Queue a config save; a save already pending absorbs this one"""
+        with self._config_save_lock:
+            self._config_dirty = True
+        try:
+            self._save_queue.put_nowait(True)
+        except queue.Full:
+            pass
+    
+    def flush_config_save(self) -> None:
+        """Write the config now if a scheduled save has not run yet"""
+        with self._config_save_lock:
+            if not self._config_dirty:
+                return
+            # Cleared before writing: an edit made during the write schedules another save
+            self._config_dirty = False
+            try:
+                self.config_manager.save_config()
+            except Exception as e:
+                logger.error(f"Error saving config: {e}")
+    
     def _get_backend_for_model(self, model: Optional[str]) -> Tuple[Optional[str], Optional[str]]:
         """
         Determine backend name and type for a model
         
+        Answers from a backend's list_models() are cached for BACKEND_CACHE_TTL
+        seconds, since probing means a round-trip to every backend. Name-based
+        guesses are not cached, so a backend that was briefly unreachable is
+        probed again on the next request.
+        
         Returns:
             Tuple of (backend_name, backend_type) or (None, None) if not found
         """
         if not model:
             return None, None
         
-        # Check each backend for the model
+        cached = self._backend_cache.get(model)
+        if cached is not None:
+            return cached
+        
+        probed = self._probe_backends_for_model(model)
+        if probed is not None:
+            self._backend_cache.set(model, probed)
+            return probed
+        
+        return self._guess_backend_for_model(model)
+    
+    def invalidate_backend_cache(self) -> None:
+        """Forget cached model -> backend lookups (e.g. after a model download)"""
+        self._backend_cache.clear()
+    
+    def _probe_backends_for_model(self, model: str) -> Optional[Tuple[str, str]]:
+        """Ask each backend whether it lists the model"""
         for backend_name, backend in self.model_loader.backends.items():
             try:
                 if model in backend.list_models():
@@ -346,23 +496,17 @@ class WebServer:
                     return backend_name, backend_type
             except Exception:
                 continue
-        
+        return None
+    
+    def _guess_backend_for_model(self, model: str) -> Tuple[str, str]:
+        """Infer a model's backend from its name when no backend lists it"""
         # Try to infer from model name patterns
-        model_lower = model.lower()
-        if any(prefix in model_lower for prefix in ["gpt", "openai"]):
-            return "openai", "openai"
-        elif any(prefix in model_lower for prefix in ["claude", "anthropic"]):
-            return "anthropic", "anthropic"
-        elif any(prefix in model_lower for prefix in ["gemini", "google"]):
-            return "google", "google"
-        elif any(prefix in model_lower for prefix in ["mistral"]):
-            return "mistral-ai", "mistral-ai"
-        elif any(prefix in model_lower for prefix in ["command", "cohere"]):
-            return "cohere", "cohere"
-        elif any(prefix in model_lower for prefix in ["groq", "llama-3", "mixtral"]):
-            # Check if it's groq format
-            if "-" in model and any(x in model for x in ["70b", "8b"]):
-                return "groq", "groq"
+        matches = _MODEL_PREFIX_RE.findall(model.lower())
+        if matches:
+            _, backend_name, backend_type = min(_MODEL_PREFIX_LOOKUP[m] for m in matches)
+            # Groq models are only recognised in their "<name>-70b/8b-..." form
+            if backend_name != "groq" or ("-" in model and any(x in model for x in ["70b", "8b"])):
+                return backend_name, backend_type
         
         # Default to ollama for unknown models (likely local)
         return "ollama", "ollama"
@@ -0,0 +1,47 @@
+"""
+Shared pytest fixtures for the LocalMind test suite
+"""
+
+import pytest
+import src.web.server as server_module
+from src.core.conversation_manager import ConversationManager
+from src.core.model_registry import ModelRegistry
+from src.core.shared_context import SharedContextManager
+from src.core.usage_tracker import UsageTracker
+from src.utils.config import ConfigManager
+
+
+@pytest.fixture(scope="session")
+def config_manager():
+    """Create one config manager for the whole session.
+    
+    Tests must not mutate it; use config_manager_fresh for that.
+    """
+    return ConfigManager()
+
+
+@pytest.fixture
+def config_manager_fresh():
+    """Create a config manager private to a single test."""
+    return ConfigManager()
+
+
+@pytest.fixture(scope="module")
+def isolated_storage(tmp_path_factory):
+    """Give web servers built in this module private storage.
+    
+    By default WebServer's managers read and rewrite repo-root files
+    (conversations/, shared_context.json, models/registry.json) and
+    ~/.localmind/usage.json. Under pytest-xdist two workers would write
+    them at once, so servers built while this fixture is active get
+    managers rooted in a temporary directory instead.
+    """
+    root = tmp_path_factory.mktemp("storage")
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(server_module, "ConversationManager",
+                   lambda: ConversationManager(root / "conversations"))
+        mp.setattr(server_module, "SharedContextManager",
+                   lambda: SharedContextManager(root / "shared_context.json"))
+        mp.setattr(server_module, "ModelRegistry", lambda: ModelRegistry(in_memory=True))
+        mp.setattr(server_module, "UsageTracker", lambda: UsageTracker(root / "usage.json"))
+        yield root
@@ -2,16 +2,8 @@
 Integration tests for backends
 """
 
-import pytest
 from src.backends.base import BaseBackend
 from src.backends.ollama import OllamaBackend
-from src.utils.config import ConfigManager
-
-
-@pytest.fixture
-def config_manager():
-    """Create a ConfigManager instance for testing"""
-    return ConfigManager()
 
 
 def test_ollama_backend_initialization(config_manager):
@@ -0,0 +1,31 @@
+"""
+Tests for LRUCache
+"""
+
+from src.core.cache import LRUCache
+
+
+def test_lru_cache_evicts_least_recently_used():
+    """Test that the oldest unused entry is evicted at maxsize."""
+    cache = LRUCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+    
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert len(cache) == 2
+
+
+def test_lru_cache_ttl():
+    """Test that entries expire after ttl seconds."""
+    now = [0.0]
+    cache = LRUCache(maxsize=4, ttl=10, timer=lambda: now[0])
+    cache.set("a", 1)
+    now[0] = 9.9
+    assert cache.get("a") == 1
+    now[0] = 10
+    assert cache.get("a", "missing") == "missing"
+    assert len(cache) == 0
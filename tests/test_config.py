@@ -3,7 +3,6 @@ Tests for ConfigManager
 """
 
 import pytest
-from pathlib import Path
 from src.utils.config import ConfigManager
 
 
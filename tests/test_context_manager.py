@@ -53,3 +53,10 @@ def test_format_messages_for_backend(context_manager):
     formatted = context_manager.format_messages_for_backend(messages, "openai")
     assert formatted is not None
     assert isinstance(formatted, list)
+
+
+def test_count_tokens_uses_estimate_tokens(context_manager, monkeypatch):
+    """Test that message token counts go through estimate_tokens."""
+    monkeypatch.setattr(context_manager, "estimate_tokens", lambda text: 10)
+    messages = [Message(role="user", content="hello"), Message(role="assistant", content="hi")]
+    assert context_manager.count_tokens(messages) == 2 * (10 + 4)
@@ -2,8 +2,8 @@
 Tests for ConversationManager
 """
 
+import json
 import pytest
-from pathlib import Path
 from src.core.conversation_manager import ConversationManager
 
 
@@ -78,3 +78,14 @@ def test_delete_conversation(conversation_manager):
     assert success is True
     conversation = conversation_manager.get_conversation(conv_id)
     assert conversation is None
+
+
+def test_export_conversation_iter(conversation_manager):
+    """Test streaming JSON export round-trips to the stored conversation."""
+    conv_id = conversation_manager.create_conversation(title="Export", model="test-model")
+    conversation_manager.save_message(conv_id, "user", "Hello")
+    conversation_manager.save_message(conv_id, "assistant", "Hi there")
+    
+    exported = "".join(conversation_manager.export_conversation_iter(conv_id))
+    assert json.loads(exported) == conversation_manager.get_conversation(conv_id)
+    assert conversation_manager.export_conversation_iter("missing") is None
@@ -0,0 +1,71 @@
+"""
+Tests for the orjson JSON provider
+"""
+
+import datetime
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+from flask import Flask
+
+pytest.importorskip("orjson")
+
+from src.web.json_provider import OrjsonProvider  # noqa: E402
+
+
+class _Html:
+    """Object exposing __html__, like markupsafe.Markup"""
+    
+    def __html__(self):
+        return "<b>hi</b>"
+
+
+@pytest.fixture(scope="module")
+def app():
+    """Create a bare app using OrjsonProvider."""
+    flask_app = Flask(__name__)
+    flask_app.json = OrjsonProvider(flask_app)
+    return flask_app
+
+
+@pytest.fixture(scope="module")
+def provider(app):
+    """Return the app's OrjsonProvider."""
+    return app.json
+
+
+@pytest.mark.parametrize("value,expected", [
+    (Decimal("1.50"), '"1.50"'),
+    (Path("models") / "registry.json", f'"{Path("models") / "registry.json"}"'),
+    ({3}, "[3]"),
+    (frozenset({"a"}), '["a"]'),
+    (_Html(), '"<b>hi</b>"'),
+    ({1: "a"}, '{"1":"a"}'),
+    (datetime.datetime(2024, 1, 2, 3, 4, 5), '"2024-01-02T03:04:05"'),
+    (datetime.datetime(2024, 1, 2, 3, 4, 5, tzinfo=datetime.timezone.utc), '"2024-01-02T03:04:05+00:00"'),
+    (datetime.date(2024, 1, 2), '"2024-01-02"'),
+])
+def test_dumps(provider, value, expected):
+    """Test the encoded form of types handled by _default and by orjson natively."""
+    assert provider.dumps(value) == expected
+
+
+def test_dumps_rejects_unknown_types(provider):
+    """Test that unsupported objects raise TypeError."""
+    with pytest.raises(TypeError):
+        provider.dumps(object())
+
+
+def test_loads_accepts_bytes(provider):
+    """Test decoding from bytes and str."""
+    assert provider.loads(b'{"a": [1, 2]}') == {"a": [1, 2]}
+    assert provider.loads('{"a": null}') == {"a": None}
+
+
+def test_response_is_compact_json(app, provider):
+    """Test that response() emits compact JSON bytes with the JSON mimetype."""
+    with app.app_context():
+        response = provider.response({"a": 1})
+    assert response.mimetype == "application/json"
+    assert response.get_data() == b'{"a":1}'
@@ -2,16 +2,10 @@
 Tests for ModelLoader
 """
 
+import importlib
 import pytest
-from unittest.mock import Mock, patch
-from src.core.model_loader import ModelLoader
-from src.utils.config import ConfigManager
-
-
-@pytest.fixture
-def config_manager():
-    """Create a test config manager."""
-    return ConfigManager()
+from src.backends.base import BaseBackend
+from src.core.model_loader import ModelLoader, _BACKEND_CLASSES
 
 
 @pytest.fixture
@@ -39,3 +33,10 @@ def test_get_backend(model_loader):
     # May be None if no backends are available
     assert backend is None or hasattr(backend, 'list_models')
 
+
+@pytest.mark.parametrize("backend_type", sorted(_BACKEND_CLASSES))
+def test_backend_class_table(backend_type):
+    """Test that each lazily imported backend resolves to a BaseBackend subclass."""
+    module_name, class_name, _ = _BACKEND_CLASSES[backend_type]
+    module = importlib.import_module(f"src.backends.{module_name}")
+    assert issubclass(getattr(module, class_name), BaseBackend)
@@ -3,20 +3,13 @@ Tests for ModelRegistry
 """
 
 import pytest
-from pathlib import Path
 from src.core.model_registry import ModelRegistry
 
 
 @pytest.fixture
-def temp_registry_path(tmp_path):
-    """Create a temporary registry path."""
-    return tmp_path / "registry.json"
-
-
-@pytest.fixture
-def model_registry(temp_registry_path):
-    """Create a test model registry."""
-    return ModelRegistry(registry_path=temp_registry_path)
+def model_registry():
+    """Create a test model registry that never touches disk."""
+    return ModelRegistry(in_memory=True)
 
 
 def test_model_registry_initialization(model_registry):
@@ -3,51 +3,38 @@ Unit tests for ModuleLoader
 """
 
 import pytest
-from pathlib import Path
 from src.core.module_loader import ModuleLoader
-from src.core.model_loader import ModelLoader
-from src.utils.config import ConfigManager
 
 
-@pytest.fixture
-def config_manager():
-    """Create a ConfigManager instance for testing"""
-    return ConfigManager()
-
-
-@pytest.fixture
-def model_loader(config_manager):
-    """Create a ModelLoader instance for testing"""
-    return ModelLoader(config_manager)
-
-
-@pytest.fixture
-def module_loader(config_manager, model_loader):
+@pytest.fixture(scope="module")
+def module_loader():
     """Create a ModuleLoader instance for testing"""
     return ModuleLoader()
 
 
-def test_list_modules(module_loader):
+@pytest.fixture(scope="module")
+def modules_list(module_loader):
+    """List the registered modules once for the tests that only read it"""
+    return module_loader.list_modules()
+
+
+def test_list_modules(modules_list):
     """Test listing available modules"""
-    modules = module_loader.list_modules()
-    
-    assert isinstance(modules, list)
-    assert len(modules) > 0
+    assert isinstance(modules_list, list)
+    assert len(modules_list) > 0
     
     # Check module structure
-    for module_info in modules:
+    for module_info in modules_list:
         assert "name" in module_info
         assert "description" in module_info
         assert isinstance(module_info["name"], str)
         assert isinstance(module_info["description"], str)
 
 
-def test_get_module(module_loader):
+def test_get_module(module_loader, modules_list):
     """Test getting a specific module"""
-    modules = module_loader.list_modules()
-    
-    if len(modules) > 0:
-        module_name = modules[0]["name"]
+    if len(modules_list) > 0:
+        module_name = modules_list[0]["name"]
         module = module_loader.get_module(module_name)
         
         assert module is not None
@@ -70,11 +57,9 @@ def test_process_input_with_modules(module_loader):
     assert result is None or isinstance(result, dict)
 
 
-def test_module_info_structure(module_loader):
+def test_module_info_structure(module_loader, modules_list):
     """Test that module info has correct structure"""
-    modules = module_loader.list_modules()
-    
-    for module_info in modules:
+    for module_info in modules_list:
         # Check required fields
         assert "name" in module_info
         assert "description" in module_info
@@ -86,3 +71,11 @@ def test_module_info_structure(module_loader):
             assert "name" in info
             assert "description" in info
 
+
+def test_find_module_for_prompt_exclude(module_loader):
+    """Test that an excluded module is not probed"""
+    module = module_loader.find_module_for_prompt("debug this python function")
+    
+    if module is not None:
+        other = module_loader.find_module_for_prompt("debug this python function", exclude=module.name)
+        assert other is not module
@@ -0,0 +1,37 @@
+"""
+Tests for shared route helpers
+"""
+
+import pytest
+from flask import Flask, request as flask_request
+from src.web.routes.base import get_json_body
+
+
+@pytest.fixture(scope="module", params=["orjson", "default"])
+def app(request):
+    """Create a bare Flask app, with and without the orjson JSON provider."""
+    flask_app = Flask(__name__)
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+        from src.web.json_provider import OrjsonProvider
+        flask_app.json = OrjsonProvider(flask_app)
+    return flask_app
+
+
+@pytest.mark.parametrize("data,content_type,expected", [
+    ('{"a": 1}', "application/json", {"a": 1}),
+    ("hello", "text/plain", None),
+    ("{not json", "application/json", None),
+    ("", "application/json", None),
+])
+def test_get_json_body(app, data, content_type, expected):
+    """Test that valid, non-JSON and malformed bodies are handled the same by both providers."""
+    with app.test_request_context("/", method="POST", data=data, content_type=content_type):
+        assert get_json_body() == expected
+
+
+def test_get_json_body_keeps_request_data(app):
+    """Test that the body is still readable after parsing."""
+    with app.test_request_context("/", method="POST", data='{"a": 1}', content_type="application/json"):
+        get_json_body()
+        assert flask_request.get_data() == b'{"a": 1}'
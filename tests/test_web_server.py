@@ -2,22 +2,19 @@
 Tests for WebServer
 """
 
+import threading
+import time
 import pytest
-from unittest.mock import Mock, patch
-from src.web.server import WebServer
-from src.utils.config import ConfigManager
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+from src.web.server import WebServer, BACKEND_CACHE_TTL
+from src.web.routes.model_routes import MAX_PENDING_DOWNLOADS
 
 
 @pytest.fixture
-def config_manager():
-    """Create a test config manager."""
-    return ConfigManager()
-
-
-@pytest.fixture
-def web_server(config_manager):
+def web_server(config_manager, isolated_storage):
     """Create a test web server."""
-    return WebServer(config_manager, host="127.0.0.1", port=5001)
+    return WebServer(config_manager, host="127.0.0.1", port=0)
 
 
 def test_web_server_initialization(web_server):
@@ -44,3 +41,157 @@ def test_success_response_helper(web_server):
     assert response["message"] == "Success"
     assert response["test"] == "data"
 
+
+def test_config_saves_coalesce(web_server, monkeypatch):
+    """Test that rapid config saves coalesce into one write."""
+    writes = []
+    monkeypatch.setattr(web_server.config_manager, "save_config", lambda: writes.append(1))
+    
+    for _ in range(5):
+        web_server.schedule_config_save()
+    web_server.flush_config_save()
+    assert len(writes) == 1
+    
+    # The worker's queued wake-up finds nothing left to write
+    time.sleep(0.5)
+    assert len(writes) == 1
+
+
+class _ListingBackend:
+    """Backend stand-in that counts list_models() probes"""
+    
+    def __init__(self, models, fail=False):
+        self.models = models
+        self.fail = fail
+        self.calls = 0
+    
+    def list_models(self):
+        self.calls += 1
+        if self.fail:
+            raise ConnectionError("backend unreachable")
+        return self.models
+    
+    def get_backend_info(self):
+        return {"type": "ollama"}
+
+
+@pytest.fixture
+def listing_backend(web_server, monkeypatch):
+    """Install a single probe-counting backend on the web server."""
+    backend = _ListingBackend(["llama3"])
+    monkeypatch.setattr(web_server, "model_loader", SimpleNamespace(backends={"ollama": backend}))
+    return backend
+
+
+def test_backend_cache_ttl(web_server, listing_backend, monkeypatch):
+    """Test that cached backend lookups expire after BACKEND_CACHE_TTL."""
+    now = [0.0]
+    monkeypatch.setattr(web_server._backend_cache, "timer", lambda: now[0])
+    
+    assert web_server._get_backend_for_model("llama3") == ("ollama", "ollama")
+    web_server._get_backend_for_model("llama3")
+    assert listing_backend.calls == 1
+    
+    now[0] = BACKEND_CACHE_TTL
+    web_server._get_backend_for_model("llama3")
+    assert listing_backend.calls == 2
+
+
+def test_invalidate_backend_cache(web_server, listing_backend):
+    """Test that invalidating the cache forces a new probe."""
+    web_server._get_backend_for_model("llama3")
+    web_server.invalidate_backend_cache()
+    web_server._get_backend_for_model("llama3")
+    assert listing_backend.calls == 2
+
+
+def test_backend_guess_not_cached(web_server, listing_backend):
+    """Test that name-based fallbacks are not cached when probing fails."""
+    listing_backend.fail = True
+    web_server._get_backend_for_model("mixtral-8x7b-32768")
+    web_server._get_backend_for_model("mixtral-8x7b-32768")
+    assert listing_backend.calls == 2
+    assert len(web_server._backend_cache) == 0
+
+
+def test_download_rejected_when_queue_full(web_server, listing_backend):
+    """Test that downloads past MAX_PENDING_DOWNLOADS get a 429."""
+    for i in range(MAX_PENDING_DOWNLOADS):
+        web_server.download_progress[f"ollama_m{i}"] = {"status": "downloading", "progress": 0}
+    
+    response = web_server.app.test_client().post("/api/models/download", json={"model": "llama3"})
+    
+    assert response.status_code == 429
+    assert response.get_json()["error_type"] == "rate_limit"
+    assert len(web_server.download_progress) == MAX_PENDING_DOWNLOADS
+
+
+class _FakePull:
+    """Stand-in for an 'ollama pull' Popen that prints progress then exits"""
+    
+    def __init__(self, returncode):
+        self.stdout = iter(["pulling manifest\n", "pulling 8eeb52dfb3bb...  42%\r", "Error: pull failed\n"])
+        self.returncode = returncode
+    
+    def wait(self):
+        return self.returncode
+    
+    def terminate(self):
+        pass
+
+
+class _DownloadingBackend:
+    """Backend stand-in whose download_model() returns a canned result"""
+    
+    def __init__(self, result):
+        self.result = result
+    
+    def download_model(self, model_name):
+        return self.result
+
+
+@pytest.mark.parametrize("make_result", [
+    lambda: {"status": "error", "error": "API key required"},
+    lambda: {"status": "downloading", "process": _FakePull(returncode=1)},
+], ids=["backend-error", "pull-exit-code"])
+def test_download_failure_reported(web_server, monkeypatch, make_result):
+    """Test that failed downloads end with an error status."""
+    backend = _DownloadingBackend(make_result())
+    monkeypatch.setattr(web_server, "model_loader", SimpleNamespace(backends={"ollama": backend}))
+    
+    response = web_server.app.test_client().post("/api/models/download", json={"model": "llama3"})
+    download_id = response.get_json()["download_id"]
+    web_server.download_pool.shutdown(wait=True)
+    
+    progress = web_server.download_progress[download_id]
+    assert progress["status"] == "error"
+    assert progress["error"]
+    assert not web_server.download_processes
+
+
+class _BlockingBackend:
+    """Backend stand-in whose download_model() waits until released"""
+    
+    def __init__(self):
+        self.release = threading.Event()
+    
+    def download_model(self, model_name):
+        self.release.wait(5)
+        return {"status": "success"}
+
+
+def test_queued_download_cancelled_at_shutdown(web_server, monkeypatch):
+    """Test that downloads dropped by shutdown_downloads() end in error."""
+    backend = _BlockingBackend()
+    monkeypatch.setattr(web_server, "model_loader", SimpleNamespace(backends={"ollama": backend}))
+    monkeypatch.setattr(web_server, "download_pool", ThreadPoolExecutor(max_workers=1))
+    client = web_server.app.test_client()
+    
+    running = client.post("/api/models/download", json={"model": "llama3"}).get_json()["download_id"]
+    queued = client.post("/api/models/download", json={"model": "mistral"}).get_json()["download_id"]
+    web_server.shutdown_downloads()
+    backend.release.set()
+    web_server.download_pool.shutdown(wait=True)
+    
+    assert web_server.download_progress[running]["status"] == "completed"
+    assert web_server.download_progress[queued]["status"] == "error"